@@ -445,3 +445,18 @@ def test_merge_complex_structure():
     assert dd.database.backup.host == "backup"
     assert dd.cache.enabled is True
     assert dd.logging.level == "INFO"
+
+
+def test_flatten_parallel_matches_serial():
+    """Test that parallel flatten produces the same mapping as serial."""
+    data = {f"top{i}": {"a": {"b": i}, "items": [{"x": i}]} for i in range(300)}
+    dd = DataDict(data)
+    serial = dd.flatten(expand_lists=True)
+    parallel = dd.flatten(expand_lists=True, parallel=True)
+    assert parallel == serial
+
+
+def test_flatten_parallel_below_threshold():
+    """Test that parallel=True on small structures still flattens correctly."""
+    dd = DataDict({"a": {"b": 1}})
+    assert dd.flatten(parallel=True) == {"a.b": 1}
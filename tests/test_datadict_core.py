@@ -429,3 +429,85 @@ def test_update_kwargs():
     dd = DataDict()
     dd.update(c=3)
     assert dd.c == 3
+
+
+# ==============================================================
+# Test from_parsed() adoption fast-path.
+# ==============================================================
+
+
+def test_from_parsed_wraps_all_tables():
+    """Test that from_parsed converts every nested table to a DataDict."""
+    raw = {"a": {"b": 1}}
+    dd = DataDict.from_parsed(raw)
+    assert type(dd) is DataDict
+    assert type(dd.a) is DataDict
+    assert dd.a.b == 1
+    assert dd == {"a": {"b": 1}}
+
+
+def test_from_parsed_handles_lists_of_tables():
+    """Test that dicts nested inside lists are wrapped and lists reused."""
+    raw = {"servers": [{"host": "a"}, {"host": "b"}], "ports": [1, 2]}
+    servers = raw["servers"]
+    dd = DataDict.from_parsed(raw)
+    assert all(type(s) is DataDict for s in dd.servers)
+    assert dd.servers[0].host == "a"
+    # Lists are adopted in place, not copied
+    assert dd.servers is servers
+    assert dd.ports == [1, 2]
+
+
+def test_from_parsed_result_is_mutable_and_freezable():
+    """Test that adopted instances support normal DataDict behavior."""
+    dd = DataDict.from_parsed({"a": {"b": 1}})
+    dd.a.c = {"d": 2}
+    assert dd.a.c.d == 2
+    dd.freeze()
+    with pytest.raises(TypeError, match="frozen"):
+        dd.a.b = 3
+
+
+def test_from_parsed_idempotent():
+    """Test that passing an existing DataDict returns it unchanged."""
+    dd = DataDict({"a": 1})
+    assert DataDict.from_parsed(dd) is dd
+
+
+def test_from_parsed_rejects_non_dict():
+    """Test that non-dict input raises TypeError."""
+    with pytest.raises(TypeError, match="plain dict"):
+        DataDict.from_parsed([1, 2])
+
+
+# ==============================================================
+# Test the copy fast-path in __init__.
+# ==============================================================
+
+
+def test_copy_fast_path_shares_wrapped_children():
+    """Test that copying a DataDict skips re-wrapping and shares children."""
+    src = DataDict({"a": {"b": 1}})
+    copy = DataDict(src)
+    assert copy == src
+    assert copy["a"] is src["a"]
+
+
+def test_copy_rewraps_for_subclass():
+    """Test that copying into a subclass re-wraps children as the subclass."""
+
+    class MyDict(DataDict):
+        pass
+
+    src = DataDict({"a": {"b": 1}})
+    md = MyDict(src)
+    assert type(md.a) is MyDict
+    assert md.a.b == 1
+
+
+def test_copy_rewraps_non_coerced_source():
+    """Test that copying a coerce_mapping=False source re-wraps plain dicts."""
+    src = DataDict({}, coerce_mapping=False)
+    src["plain"] = {"x": 1}
+    copy = DataDict(src)
+    assert type(copy["plain"]) is DataDict
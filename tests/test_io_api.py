@@ -727,3 +727,32 @@ def test_dumps_with_sanitize_true():
     data = {"path": Path("/test")}
     toml_str = tomly.dumps(data, sanitize=True)
     assert 'path = "/test"' in toml_str
+
+
+# ==============================================================
+# Test the wrap=True opt-in for loads() and load().
+# ==============================================================
+
+
+def test_loads_wrap_returns_datadict():
+    """Test loads with wrap=True returns a DataDict tree."""
+    data = tomly.loads('[server]\nhost = "localhost"\n', wrap=True)
+    assert type(data) is tomly.DataDict
+    assert type(data.server) is tomly.DataDict
+    assert data.server.host == "localhost"
+
+
+def test_loads_wrap_default_is_plain_dict():
+    """Test loads without wrap still returns plain dicts."""
+    data = tomly.loads('[server]\nhost = "localhost"\n')
+    assert type(data) is dict
+    assert type(data["server"]) is dict
+
+
+def test_load_wrap_from_path(tmp_path):
+    """Test load with wrap=True from a file path."""
+    file_path = tmp_path / "config.toml"
+    file_path.write_text('[[servers]]\nhost = "a"\n[[servers]]\nhost = "b"\n')
+    data = tomly.load(file_path, wrap=True)
+    assert type(data) is tomly.DataDict
+    assert [s.host for s in data.servers] == ["a", "b"]